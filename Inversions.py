@@ -1,29 +1,90 @@
 # type: ignore
 
+import functools
 import math
 
 import manim as ma
 import numpy as np
-import numpy.linalg as linalg
 from manim.mobject.geometry import ArcPolygon
+from numba import njit
+
+
+@njit("UniTuple(f8, 3)(f8, f8, f8, f8, f8, f8, f8)", cache=True, fastmath=True)
+def _circ_inv(px, py, pz, cx, cy, cz, r):
+    dx = px - cx
+    dy = py - cy
+    dz = pz - cz
+    n2 = dx * dx + dy * dy + dz * dz
+    if n2 == 0.0:
+        # p == c is the only true degenerate case; its inverse is undefined,
+        # so leave the point at the center rather than producing inf/nan.
+        return (cx, cy, cz)
+    scale = (r * r) / n2
+    return (cx + scale * dx, cy + scale * dy, cz + scale * dz)
+
+
+@njit("UniTuple(f8, 3)(f8, f8, f8, f8, f8, f8)", cache=True, fastmath=True)
+def _circumcircle(x1, y1, x2, y2, x3, y3):
+    c = (x1 - x2) ** 2 + (y1 - y2) ** 2
+    a = (x2 - x3) ** 2 + (y2 - y3) ** 2
+    b = (x3 - x1) ** 2 + (y3 - y1) ** 2
+    s = 2 * (a * b + b * c + c * a) - (a * a + b * b + c * c)
+    wa = a * (b + c - a)
+    wb = b * (c + a - b)
+    wc = c * (a + b - c)
+    px = (wa * x1 + wb * x2 + wc * x3) / s
+    py = (wa * y1 + wb * y2 + wc * y3) / s
+    # s == 16 * Area^2, so the circumradius R = abc / (4 * Area) reduces to
+    # sqrt(a * b * c / s) with a, b, c already squared side lengths.
+    r = math.sqrt(a * b * c / s)
+    return (px, py, r)
+
+
+@functools.lru_cache(maxsize=None)
+def _tex_cached(*parts):
+    return ma.MathTex(*parts)
+
+
+def _tex(*parts) -> ma.MathTex:
+    """MathTex memoized on its LaTeX strings.
+
+    Every MathTex pays a LaTeX + dvisvgm round trip; the expressions in
+    this scene are static, so compile each distinct one once per process.
+    Returns a copy so callers can color/position it freely.
+    """
+    return _tex_cached(*parts).copy()
+
+
+class _LabeledPoint(ma.VGroup):
+    """A dot with a MathTex label, exposed as plain attributes.
+
+    The per-frame updaters read `.dot` / `.txt` with a single attribute
+    load instead of hashing a string key through VDict.__getitem__.
+    """
+
+    def __init__(self, coords: np.ndarray, txt: str, color=ma.WHITE):
+        dot = ma.Dot(point=coords)
+        label = _tex(txt).move_to(coords).shift(ma.UP / 2)
+        super().__init__(dot, label)
+        self.dot = dot
+        self.txt = label
+        self.set_color(color)
 
 
 class ManimUtils:
     @staticmethod
-    def create_point(coords: np.ndarray, txt: str, color=ma.WHITE) -> ma.VDict:
-        return ma.VDict(
-            {
-                "dot": ma.Dot(point=coords),
-                "txt": ma.MathTex(txt).move_to(coords).shift(ma.UP / 2),
-            }
-        ).set_color(color)
+    def create_point(coords: np.ndarray, txt: str, color=ma.WHITE) -> _LabeledPoint:
+        return _LabeledPoint(coords, txt, color=color)
 
 
 class MathUtils:
+    # Scratch buffer reused by circ_inverse_of to avoid a per-call allocation
+    _INV_OUT = np.empty(3)
+
     @staticmethod
     def distance(a: np.ndarray, b: np.ndarray) -> float:
         """Euclidean distance"""
-        return linalg.norm(a - b)
+        return math.hypot(a[0] - b[0], a[1] - b[1], a[2] - b[2])
 
     @staticmethod
     def circ_inverse_of(p: np.ndarray, c: np.ndarray, r: float) -> np.ndarray:
@@ -32,35 +93,26 @@ class MathUtils:
         The coordinates are given with respect to the default coordinate frame
         with origin: `ma.ORIGIN`.
         `p_norm * prim_norm == r ** 2`
-        """
 
-        adj_direction = p - c
-        p_norm = linalg.norm(adj_direction)
-        prim_norm = (r ** 2) / p_norm
+        Returns a shared scratch buffer that is overwritten on the next
+        call; callers must copy if they need to keep it (`move_to` does).
+        """
 
-        scale = prim_norm / p_norm
-        scale = min(scale, 9223372036854775807)
-        return c + scale * adj_direction
+        out = MathUtils._INV_OUT
+        out[0], out[1], out[2] = _circ_inv(p[0], p[1], p[2], c[0], c[1], c[2], r)
+        return out
 
     @staticmethod
     def define_circle(p1, p2, p3):
-        x1 = p1[0]
-        y1 = p1[1]
-        x2 = p2[0]
-        y2 = p2[1]
-        x3 = p3[0]
-        y3 = p3[1]
-        c = (x1 - x2) ** 2 + (y1 - y2) ** 2
-        a = (x2 - x3) ** 2 + (y2 - y3) ** 2
-        b = (x3 - x1) ** 2 + (y3 - y1) ** 2
-        s = 2 * (a * b + b * c + c * a) - (a * a + b * b + c * c) 
-        px = (a * (b + c - a) * x1 + b * (c + a - b) * x2 + c * (a + b - c) * x3) / s
-        py = (a * (b + c - a) * y1 + b * (c + a - b) * y2 + c * (a + b - c) * y3) / s 
-        ar = a ** 0.5
-        br = b ** 0.5
-        cr = c ** 0.5 
-        r = ar * br * cr / ((ar + br + cr) * (-ar + br + cr) * (ar - br + cr) * (ar + br - cr)) ** 0.5
-        return (np.array((px, py, 0)), r)
+        px, py, r = _circumcircle(p1[0], p1[1], p2[0], p2[1], p3[0], p3[1])
+        return (np.array((px, py, 0.0)), r)
+
+    @staticmethod
+    def circ_inverse_batch(P: np.ndarray, c: np.ndarray, r: float) -> np.ndarray:
+        """Vectorized `circ_inverse_of` over an `(N, 3)` array of points."""
+        diff = P - c
+        n2 = np.einsum("ij,ij->i", diff, diff)
+        return c + ((r * r) / n2)[:, None] * diff
 
     @staticmethod
     def circle_angle(p, center):
@@ -76,9 +128,9 @@ class CircularInversionIntro(ma.Scene):
         self.A_prime = ManimUtils.create_point(np.zeros((3,)), r"A'", color=ma.RED)
 
         # origin-A / origin-A' line
-        self.line = ma.Line(self.origin["dot"], self.A_prime["dot"])
-        self.radius_line = ma.Line(self.origin["dot"], np.array((0, -self.RADIUS, 0)))
-        self.radius_label = ma.Tex("R = " + str(self.RADIUS)).align_to(self.origin["dot"]).shift(ma.LEFT / 3, ma.DOWN *self.RADIUS / 2).rotate(ma.TAU / 4)
+        self.line = ma.Line(self.origin.dot, self.A_prime.dot)
+        self.radius_line = ma.Line(self.origin.dot, np.array((0, -self.RADIUS, 0)))
+        self.radius_label = ma.Tex("R = " + str(self.RADIUS)).align_to(self.origin.dot).shift(ma.LEFT / 3, ma.DOWN *self.RADIUS / 2).rotate(ma.TAU / 4)
         self.total = ma.VGroup(
             self.inversion_circle,
             self.origin,
@@ -91,85 +143,149 @@ class CircularInversionIntro(ma.Scene):
         oa = r"\overline{OA}"
         oa_prime = r"\overline{OA'}"
         self.constraint = (
-            ma.MathTex(oa, r"\cdot", oa_prime, r"= R^2")
+            _tex(oa, r"\cdot", oa_prime, r"= R^2")
             .set_color_by_tex(oa, self.A.color)
             .set_color_by_tex(oa_prime, self.A_prime.color)
-            .align_to(self.origin["dot"])
+            .align_to(self.origin.dot)
             .shift(ma.RIGHT * 4, ma.UP / 2)
         )
 
-        self.ex = self._new_ex()
+        self.ex = self._new_ex
 
+    @functools.cached_property
     def _new_ex(self) -> ma.MathTex:
         oa = "1"
         oa_prime = "4"
 
         return (
-            ma.MathTex(r"\frac{2^2}{", oa, r"} = ", oa_prime)
+            _tex(r"\frac{2^2}{", oa, r"} = ", oa_prime)
             .set_color_by_tex(oa, self.A.color)
             .set_color_by_tex(oa_prime, self.A_prime.color)
-            .align_to(self.origin["dot"])
+            .align_to(self.origin.dot)
             .shift(ma.RIGHT * 4, ma.DOWN / 1.5)
         )
 
+    @functools.cached_property
     def rearrange_constraint(self) -> ma.MathTex:
         # Scuffed way to rearrange the constraint eq
         oa = r"\overline{OA}"
         oa_prime = r"\overline{OA'}"
         return (
-            ma.MathTex(r"\frac{R^2}{", oa, r"} = ", oa_prime)
+            _tex(r"\frac{R^2}{", oa, r"} = ", oa_prime)
             .set_color_by_tex(oa, self.A.color)
             .set_color_by_tex(oa_prime, self.A_prime.color)
-            .align_to(self.origin["dot"])
+            .align_to(self.origin.dot)
             .shift(ma.RIGHT * 4, ma.UP / 1.5)
         )
 
     def add_updaters(self) -> None:
-        self.A_prime.add_updater(
-            lambda x: x["dot"].move_to(
-                MathUtils.circ_inverse_of(
-                    self.A["dot"].get_center(),
-                    self.origin["dot"].get_center(),
-                    self.RADIUS,
-                )
-            )
-            and x["txt"].move_to(x["dot"]).shift(ma.UP / 2),
-        )
-        self.line.add_updater(
-            lambda x: x.become(
-                ma.Line(
-                    self.origin["dot"].get_center(),
-                    max(
-                        self.A["dot"],
-                        self.A_prime["dot"],
-                        key=lambda x: MathUtils.distance(
-                            x.get_center(), self.origin["dot"].get_center()
-                        ),
-                    ),
-                ),
-                copy_submobjects=False,
-            )
+        # Bind the attribute chains the updaters need once, at closure
+        # creation; per-frame lookups are then plain LOAD_FASTs.
+        inv_of = MathUtils.circ_inverse_of
+        R = self.RADIUS
+        dot_O = self.origin.dot
+        dot_A = self.A.dot
+        dot_Ap = self.A_prime.dot
+        txt_Ap = self.A_prime.txt
+        half_up = ma.UP / 2
+        last_pos = None
+        last_out = None
+
+        def a_prime_updater(x):
+            # A sits still during every wait(); skip the inversion and the
+            # mobject-tree moves when neither end has moved. A' must be
+            # checked too: Transform-based animations like FadeIn drag A'
+            # between stale copies, and the updater has to win them back.
+            nonlocal last_pos, last_out
+            p = dot_A.get_center()
+            if (
+                last_pos is not None
+                and np.array_equal(p, last_pos)
+                and np.array_equal(dot_Ap.get_center(), last_out)
+            ):
+                return
+            last_pos = p.copy()
+            inv = inv_of(p, dot_O.get_center(), R)
+            dot_Ap.move_to(inv)
+            txt_Ap.move_to(inv).shift(half_up)
+            last_out = dot_Ap.get_center().copy()
+
+        self.A_prime.add_updater(a_prime_updater)
+        def line_updater(x):
+            o = dot_O.get_center()
+            a = dot_A.get_center()
+            ap = dot_Ap.get_center()
+            # Compare squared distances; no sqrt needed to pick the far point
+            da = a - o
+            dap = ap - o
+            far = a if np.dot(da, da) >= np.dot(dap, dap) else ap
+            x.put_start_and_end_on(o, far)
+
+        self.line.add_updater(line_updater)
+
+    def shift_A(self, delta, run_time) -> None:
+        """Shift `A` while moving `A'` along its pre-baked inverse path.
+
+        For a scripted straight-line move of `A` the inverse trajectory is
+        deterministic, so sample it once at frame rate, invert the whole
+        batch, and drive `A'` by indexing the table with the eased alpha
+        instead of re-running the inversion updater 60x per second.
+        Indexing by alpha keeps A' parameterized exactly like A, unlike
+        MoveAlongPath whose path-proportion lookup is not A's parameter.
+        """
+        start = self.A.dot.get_center()
+        n = max(int(run_time * ma.config.frame_rate), 2)
+        samples = start + np.linspace(0.0, 1.0, n)[:, None] * delta
+        inv = MathUtils.circ_inverse_batch(samples, self.origin.dot.get_center(), self.RADIUS)
+        # A' is moved as a whole group; its center sits at a fixed offset
+        # from the dot the updater normally places.
+        table = inv + (self.A_prime.get_center() - self.A_prime.dot.get_center())
+        smooth = ma.utils.rate_functions.smooth
+        last = n - 1
+
+        def follow_table(x, alpha):
+            # A.animate.shift eases with the default smooth rate; apply the
+            # same easing here so O, A, A' stay collinear mid-segment. The
+            # animation's own rate_func is linear, so alpha is raw here.
+            t = smooth(alpha) * last
+            i = int(t)
+            if i >= last:
+                x.move_to(table[last])
+                return
+            x.move_to(table[i] + (t - i) * (table[i + 1] - table[i]))
+
+        self.A_prime.suspend_updating()
+        self.play(
+            self.A.animate.shift(delta),
+            ma.UpdateFromAlphaFunc(self.A_prime, follow_table, rate_func=ma.utils.rate_functions.linear),
+            run_time=run_time,
         )
+        self.A_prime.resume_updating()
 
     def trace_circle(self, r, c) -> None:
         self.circle = ma.Circle(radius=r, color=ma.GREEN).shift(c[0] * ma.RIGHT, c[1] * ma.UP)
         offset_circle = ma.Circle(radius=r, color=ma.GREEN).shift(c[0] * ma.RIGHT, (c[1] + 0.3) * ma.UP)
-        inverted_circle_points = [MathUtils.circ_inverse_of(self.circle.get_center() + ma.RIGHT * self.circle.radius, self.origin["dot"].get_center(), self.RADIUS),
-            MathUtils.circ_inverse_of(self.circle.get_center() + ma.UP * self.circle.radius, self.origin["dot"].get_center(), self.RADIUS),
-            MathUtils.circ_inverse_of(self.circle.get_center() + ma.DOWN * self.circle.radius, self.origin["dot"].get_center(), self.RADIUS)
-        ]
+        cc = self.circle.get_center()
+        cr = self.circle.radius
+        R = self.RADIUS
+        pts = np.stack((
+            cc + ma.RIGHT * cr,
+            cc + ma.UP * cr,
+            cc + ma.DOWN * cr,
+        ))
+        o = self.origin.dot.get_center()
+        # Invert all three sample points in one vectorized pass
+        inverted_circle_points = MathUtils.circ_inverse_batch(pts, o, R)
         center, radius = MathUtils.define_circle(inverted_circle_points[0], inverted_circle_points[1], inverted_circle_points[2])
         def inverted_arc_updater(obj):
-            obj.become(
-                    ma.Arc(
-                        radius=radius,
-                        arc_center=center,
-                        start_angle=MathUtils.circle_angle(self.A_prime["dot"].get_center(), center),
-                        angle=ma.PI - MathUtils.circle_angle(self.A_prime["dot"].get_center(), center),
-                        color=ma.RED
-                    ),
-                    copy_submobjects=False
-            )
+            # radius/center are loop invariants; only the start angle moves.
+            # Mutate the existing Arc and regenerate its points instead of
+            # constructing a fresh mobject every frame.
+            p = self.A_prime.dot.get_center()
+            theta = math.atan2(p[1] - center[1], p[0] - center[0])
+            obj.start_angle = theta
+            obj.angle = ma.PI - theta
+            obj.generate_points()
         self.inverted_arc = ma.Arc(
             radius=radius,
             arc_center=center,
@@ -204,7 +320,7 @@ class CircularInversionIntro(ma.Scene):
 
         self.play(ma.Write(self.constraint))
         self.wait(2)
-        self.play(ma.Transform(self.constraint, self.rearrange_constraint()))
+        self.play(ma.Transform(self.constraint, self.rearrange_constraint))
         self.play(ma.Write(self.ex))
         self.wait(2)
         self.play(ma.FadeIn(self.A_prime))
@@ -216,19 +332,19 @@ class CircularInversionIntro(ma.Scene):
         self.play(ma.Unwrite(self.radius_label))
         self.play(self.constraint.animate.shift(ma.LEFT * 7, ma.DOWN * 3.5))
         self.wait(2)
-        self.play(self.A.animate.shift(ma.UP), run_time=4)
-        self.play(self.A.animate.shift(ma.DOWN), run_time=4)
-        self.play(self.A.animate.shift(ma.RIGHT), run_time=4)
+        self.shift_A(ma.UP, run_time=4)
+        self.shift_A(ma.DOWN, run_time=4)
+        self.shift_A(ma.RIGHT, run_time=4)
         self.wait(2)
-        self.play(self.A.animate.shift(ma.RIGHT), run_time=4)
+        self.shift_A(ma.RIGHT, run_time=4)
         self.wait(2)
-        self.play(self.A.animate.shift(ma.LEFT * (3 - 0.001)), run_time=6)
+        self.shift_A(ma.LEFT * (3 - 0.001), run_time=6)
         self.wait(2)
-        self.play(self.A.animate.shift(ma.RIGHT * (1.5 - 0.001)), run_time=4)
+        self.shift_A(ma.RIGHT * (1.5 - 0.001), run_time=4)
         self.trace_circle(0.5, (-2, 0))
-        self.play(self.A.animate.shift(ma.RIGHT * 1.5), run_time=4)
+        self.shift_A(ma.RIGHT * 1.5, run_time=4)
         self.trace_circle(1, (-1, 0))
-        self.play(self.A.animate.shift(ma.LEFT * (2 - 0.001)), run_time=4)
+        self.shift_A(ma.LEFT * (2 - 0.001), run_time=4)
         self.trace_circle(0.5, (-2.5 + 0.001, 0))
         
 